@@ -4,18 +4,38 @@ A Streamlit web app for tracking New Year's resolutions with milestone goals and
 """
 
 import streamlit as st
-import json
+import orjson
 import os
-from datetime import datetime, date
+from datetime import date
 import uuid
+import time
+import hmac
+import heapq
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows; locking is skipped there
+    fcntl = None
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
-# Path to the JSON data file
+# Path to the data file (an append-only log with one JSON record per line)
 DATA_FILE = "data/resolutions.json"
 
+# Lock file guarding the data file (appends share it, compaction takes it exclusively)
+LOCK_FILE = DATA_FILE + ".lock"
+
+# Compact the log once it holds this many records per live resolution
+COMPACT_FACTOR = 10
+
+# Flush appended records to disk after this many appends or this many seconds
+FSYNC_EVERY = 10
+FSYNC_INTERVAL = 5.0
+
 # Page configuration
 st.set_page_config(
     page_title="Resolution Tracker",
@@ -27,46 +47,226 @@ st.set_page_config(
 # DATA MANAGEMENT FUNCTIONS
 # =============================================================================
 
-def load_data():
+def _open_data_path(path, flags):
     """
-    Load resolutions from the JSON file.
-    Returns an empty list if the file doesn't exist or is empty.
+    Open a file in the data directory with os.open and return the descriptor.
+    The directory is only created when the open fails because it is missing,
+    so a normal save costs no extra syscall.
+    """
+    try:
+        return os.open(path, flags, 0o644)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        return os.open(path, flags, 0o644)
+
+
+@contextmanager
+def _data_lock(exclusive=False):
+    """
+    Hold a lock on LOCK_FILE for the duration of the block.
+    A separate lock file is used because compaction replaces DATA_FILE.
+    """
+    fd = _open_data_path(LOCK_FILE, os.O_RDWR | os.O_CREAT)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
+
+
+def _apply_event(state, event):
+    """
+    Apply a single log record to the state dictionary (keyed by resolution ID).
+    The state is an ID index, so the same operations used by the pages apply here.
+    """
+    op = event.get("op")
+
+    if op == "create":
+        resolution = event["resolution"]
+        state[resolution["id"]] = resolution
+    elif op == "update":
+        update_resolution(state, event["id"], event["data"])
+    elif op == "delete":
+        state.pop(event["id"], None)
+    elif op == "milestone_toggle":
+        mark_milestone_complete(state, event["id"], event["index"], event["completed"])
+        add_milestone_note(state, event["id"], event["index"], event["note"])
+
+
+def _prepare_loaded(resolutions):
+    """
+    Parse the stored date strings into date objects once, at load time.
+    Also recounts the completed milestones, so a stored count that no longer
+    matches the milestones (or is missing from older data) is corrected.
+    """
+    for res in resolutions:
+        for key in ("start_date", "target_date"):
+            if isinstance(res.get(key), str):
+                try:
+                    res[key] = date.fromisoformat(res[key])
+                except ValueError:
+                    pass
+        res["completed_count"] = count_completed_milestones(res)
+    return resolutions
+
+
+def _read_data_file():
+    """
+    Read the data file and rebuild the resolutions by replaying its log records.
+    Returns the resolutions, the number of log records read, and whether
+    the file must be rewritten before anything is appended to it (it is in
+    the older single-list format, or holds a partially written record).
+    An older-format file that isn't valid JSON raises orjson.JSONDecodeError
+    rather than being treated as empty. In a log, lines that aren't valid
+    records are skipped (and trigger a rewrite).
     """
     try:
-        if os.path.exists(DATA_FILE):
-            with open(DATA_FILE, "r") as f:
-                data = json.load(f)
-                return data if data else []
-        return []
-    except (json.JSONDecodeError, FileNotFoundError):
-        return []
+        with open(DATA_FILE, "rb") as f:
+            content = f.read()
+    except FileNotFoundError:
+        return [], 0, False
+
+    # Older data files hold a single JSON list of resolutions
+    if content.lstrip().startswith(b"["):
+        data = orjson.loads(content)
+        return _prepare_loaded(data if data else []), 0, True
+
+    # A missing final newline means the last write was cut short
+    needs_rewrite = bool(content) and not content.endswith(b"\n")
+    state = {}
+    line_count = 0
+    for line in content.splitlines():
+        if not line.strip():
+            continue
+        try:
+            event = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # Skip a partially written record
+            needs_rewrite = True
+            continue
+        if not isinstance(event, dict):
+            # Skip a line that is valid JSON but not a record
+            needs_rewrite = True
+            continue
+        _apply_event(state, event)
+        line_count += 1
+    return _prepare_loaded(list(state.values())), line_count, needs_rewrite
+
+
+@st.cache_data
+def _load_data_cached(mtime):
+    """
+    Cached wrapper around _read_data_file.
+    The file's modification time is the cache key, so the file is only
+    re-read after it has been written.
+    """
+    return _read_data_file()
+
+
+def load_data():
+    """
+    Load resolutions from the data file.
+    Returns an empty list if the file doesn't exist or is empty.
+    Rewrites a file in the older single-list format, or one holding a partially
+    written record, and compacts the log when it has grown much larger than
+    the live data.
+    """
+    mtime = os.path.getmtime(DATA_FILE) if os.path.exists(DATA_FILE) else 0
+    resolutions, line_count, needs_rewrite = _load_data_cached(mtime)
+
+    # Rewrite before anything is appended, or new records would be joined
+    # onto the closing "]" or the broken line and lost on the next load
+    if needs_rewrite or line_count > COMPACT_FACTOR * max(len(resolutions), 1):
+        # Re-read under the exclusive lock, so records that other sessions
+        # appended since the read above end up in the snapshot
+        with _data_lock(exclusive=True):
+            resolutions, _, _ = _read_data_file()
+            save_data(resolutions)
+
+    return resolutions
 
 
 def save_data(resolutions):
     """
-    Save resolutions to the JSON file.
-    Creates the data directory if it doesn't exist.
+    Rewrite the data file as a snapshot: one "create" record per resolution.
+    Call with the exclusive data lock held, or concurrent appends may be lost.
     """
-    # Ensure the data directory exists
-    os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
+    # Write to a temporary file and swap it in, so a crash never leaves a half-written log
+    tmp_file = DATA_FILE + ".tmp"
+    fd = _open_data_path(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+    with os.fdopen(fd, "wb") as f:
+        for res in resolutions:
+            f.write(orjson.dumps({"op": "create", "resolution": res}) + b"\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, DATA_FILE)
 
-    with open(DATA_FILE, "w") as f:
-        json.dump(resolutions, f, indent=2, default=str)
+    # Drop the cached copy in case the new mtime matches the old one
+    _load_data_cached.clear()
 
 
-def check_password(password):
+def append_event(event):
     """
-    Validate the password against the stored secret.
+    Append a single mutation record to the data file.
+    The record is written with one O_APPEND write; fsync only runs every
+    FSYNC_EVERY appends or FSYNC_INTERVAL seconds.
+    """
+    # Shared lock: appends don't block each other, but wait for a compaction
+    with _data_lock():
+        fd = _open_data_path(DATA_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+        try:
+            os.write(fd, orjson.dumps(event) + b"\n")
+
+            unsynced = st.session_state.get("unsynced_appends", 0) + 1
+            last_fsync = st.session_state.get("last_fsync", 0.0)
+            now = time.monotonic()
+            if unsynced >= FSYNC_EVERY or now - last_fsync >= FSYNC_INTERVAL:
+                os.fsync(fd)
+                unsynced = 0
+                st.session_state.last_fsync = now
+            st.session_state.unsynced_appends = unsynced
+        finally:
+            os.close(fd)
+
+    # Drop the cached copy in case the new mtime matches the old one
+    _load_data_cached.clear()
+
+
+@contextmanager
+def mutate_resolutions(event):
+    """
+    Context manager around a change to the resolutions in session state.
+    The block makes the change in memory (through the resolution helpers);
+    once it finishes without raising, event is appended to the data file.
+    """
+    yield
+    append_event(event)
+
+
+@st.cache_resource
+def _correct_password():
+    """
+    Look up the app password once and reuse it for later login attempts.
+    Cached by Streamlit, so the lookup survives reruns. The cache does not
+    follow edits to secrets.toml: restart the server after changing the password.
     Uses Streamlit secrets for secure password storage.
     """
     try:
         # Try to get password from Streamlit secrets (for cloud deployment)
-        correct_password = st.secrets["password"]
+        return str(st.secrets["password"])
     except (KeyError, FileNotFoundError):
         # Fallback for local development without secrets file
-        correct_password = "Lynda2026"
+        return "Lynda2026"
+
 
-    return password == correct_password
+def check_password(password):
+    """
+    Validate the password against the stored secret.
+    Uses a constant-time comparison so the check doesn't leak timing information.
+    """
+    return hmac.compare_digest(str(password).encode(), _correct_password().encode())
 
 
 # =============================================================================
@@ -79,92 +279,82 @@ def create_resolution(title, start_date, target_date, reason, importance, milest
     Returns the new resolution dictionary.
     """
     # Create the 4 milestones from descriptions
-    milestones = []
-    for desc in milestone_descriptions:
-        milestones.append({
-            "description": desc,
-            "completed": False,
-            "note": ""
-        })
+    milestones = [
+        {"description": desc, "completed": False, "note": ""}
+        for desc in milestone_descriptions
+    ]
 
     # Create the resolution
     resolution = {
-        "id": str(uuid.uuid4()),  # Unique identifier
+        "id": uuid.uuid4().hex,  # Unique identifier
         "title": title,
-        "start_date": str(start_date),
-        "target_date": str(target_date),
+        "start_date": start_date,
+        "target_date": target_date,
         "reason": reason,
         "importance": importance,
         "milestones": milestones,
+        "completed_count": 0,
         "achieved": False
     }
 
     return resolution
 
 
-def update_resolution(resolutions, resolution_id, updated_data):
+def update_resolution(res_by_id, resolution_id, updated_data):
     """
-    Update an existing resolution with new data.
-    Returns the updated list of resolutions.
+    Update an existing resolution (looked up in the ID index) with new data.
+    The resolution is edited in place, so any list holding it sees the change.
+    Returns the updated resolution, or None if not found.
     """
-    for i, res in enumerate(resolutions):
-        if res["id"] == resolution_id:
-            # Update fields that were provided
-            for key, value in updated_data.items():
-                if key != "id":  # Don't allow changing the ID
-                    resolutions[i][key] = value
-            break
-    return resolutions
-
-
-def delete_resolution(resolutions, resolution_id):
-    """
-    Delete a resolution from the list.
-    Returns the updated list of resolutions.
-    """
-    return [res for res in resolutions if res["id"] != resolution_id]
+    res = res_by_id.get(resolution_id)
+    if res is not None:
+        # Update fields that were provided
+        for key, value in updated_data.items():
+            if key != "id":  # Don't allow changing the ID
+                res[key] = value
+        # New milestones may have a different completed status
+        if "milestones" in updated_data:
+            res["completed_count"] = count_completed_milestones(res)
+            res["achieved"] = check_resolution_achieved(res)
+    return res
 
 
-def get_resolution_by_id(resolutions, resolution_id):
+def get_resolution_by_id(res_by_id, resolution_id):
     """
     Find and return a resolution by its ID.
     Returns None if not found.
     """
-    for res in resolutions:
-        if res["id"] == resolution_id:
-            return res
-    return None
+    return res_by_id.get(resolution_id)
 
 
 # =============================================================================
 # MILESTONE OPERATIONS
 # =============================================================================
 
-def mark_milestone_complete(resolutions, resolution_id, milestone_index, completed=True):
+def mark_milestone_complete(res_by_id, resolution_id, milestone_index, completed=True):
     """
     Mark a specific milestone as complete or incomplete.
     Also updates the resolution's achieved status if all milestones are complete.
-    Returns the updated list of resolutions.
+    Returns the updated resolution, or None if not found.
     """
-    for res in resolutions:
-        if res["id"] == resolution_id:
-            res["milestones"][milestone_index]["completed"] = completed
-            # Check if all milestones are now complete
-            res["achieved"] = check_resolution_achieved(res)
-            break
-    return resolutions
+    res = res_by_id.get(resolution_id)
+    if res is not None:
+        res["milestones"][milestone_index]["completed"] = completed
+        res["completed_count"] = count_completed_milestones(res)
+        # Check if all milestones are now complete
+        res["achieved"] = check_resolution_achieved(res)
+    return res
 
 
-def add_milestone_note(resolutions, resolution_id, milestone_index, note):
+def add_milestone_note(res_by_id, resolution_id, milestone_index, note):
     """
     Add or update a note for a specific milestone.
-    Returns the updated list of resolutions.
+    Returns the updated resolution, or None if not found.
     """
-    for res in resolutions:
-        if res["id"] == resolution_id:
-            res["milestones"][milestone_index]["note"] = note
-            break
-    return resolutions
+    res = res_by_id.get(resolution_id)
+    if res is not None:
+        res["milestones"][milestone_index]["note"] = note
+    return res
 
 
 # =============================================================================
@@ -173,10 +363,10 @@ def add_milestone_note(resolutions, resolution_id, milestone_index, note):
 
 def get_top_resolutions(resolutions, n=3):
     """
-    Sort resolutions by importance (descending) and return the top N.
+    Return the top N resolutions by importance (descending).
+    Uses a heap so only N items are kept ordered, not the whole list.
     """
-    sorted_resolutions = sorted(resolutions, key=lambda x: x["importance"], reverse=True)
-    return sorted_resolutions[:n]
+    return heapq.nlargest(n, resolutions, key=lambda x: x["importance"])
 
 
 def calculate_total_stars(resolutions):
@@ -184,12 +374,15 @@ def calculate_total_stars(resolutions):
     Count the total number of completed milestones across all resolutions.
     Each completed milestone = 1 star.
     """
-    total = 0
-    for res in resolutions:
-        for milestone in res["milestones"]:
-            if milestone["completed"]:
-                total += 1
-    return total
+    return sum(res["completed_count"] for res in resolutions)
+
+
+def count_completed_milestones(resolution):
+    """
+    Count the completed milestones of a single resolution.
+    Stored on the resolution as "completed_count" whenever a milestone changes.
+    """
+    return sum(1 for m in resolution["milestones"] if m["completed"])
 
 
 def check_resolution_achieved(resolution):
@@ -200,19 +393,26 @@ def check_resolution_achieved(resolution):
     return all(m["completed"] for m in resolution["milestones"])
 
 
+# Precomputed star strings, indexed by importance (0-5)
+_STARS = tuple("⭐" * i for i in range(6))
+
+
 def display_importance_stars(importance):
     """
     Display importance as stars (1-5).
     """
-    return "⭐" * importance
+    return _STARS[importance]
 
 
 def format_date(date_str):
     """
-    Format a date string for display.
+    Format a date (or date string) for display.
     """
+    if isinstance(date_str, date):
+        return date_str.strftime("%B %d, %Y")
+
     try:
-        d = datetime.strptime(str(date_str), "%Y-%m-%d")
+        d = date.fromisoformat(str(date_str))
         return d.strftime("%B %d, %Y")
     except:
         return str(date_str)
@@ -239,7 +439,7 @@ def init_session_state():
         st.session_state.selected_milestone_index = None
 
     if "resolutions" not in st.session_state:
-        st.session_state.resolutions = load_data()
+        set_resolutions(load_data())
 
     if "show_celebration" not in st.session_state:
         st.session_state.show_celebration = False
@@ -248,6 +448,33 @@ def init_session_state():
         st.session_state.edit_mode = False
 
 
+def set_resolutions(resolutions):
+    """
+    Store the resolutions in session state along with an ID -> resolution index.
+    Both hold the same dictionaries, so in-place edits show up in each.
+    """
+    st.session_state.resolutions = resolutions
+    st.session_state.res_by_id = {res["id"]: res for res in resolutions}
+
+
+def add_resolution(resolution):
+    """
+    Add a new resolution to the session's list and ID index.
+    """
+    st.session_state.resolutions.append(resolution)
+    st.session_state.res_by_id[resolution["id"]] = resolution
+
+
+def remove_resolution(resolution_id):
+    """
+    Remove a resolution from the session's list and ID index.
+    """
+    st.session_state.res_by_id.pop(resolution_id, None)
+    st.session_state.resolutions = [
+        res for res in st.session_state.resolutions if res["id"] != resolution_id
+    ]
+
+
 def navigate_to(page, resolution_id=None, milestone_index=None):
     """
     Navigate to a different page and optionally set selected items.
@@ -260,6 +487,15 @@ def navigate_to(page, resolution_id=None, milestone_index=None):
     st.session_state.edit_mode = False
 
 
+def set_state(key, value):
+    """
+    Set a single session state value.
+    Used as a button on_click callback, so the change is in place before the
+    rerun that the click triggers.
+    """
+    st.session_state[key] = value
+
+
 # =============================================================================
 # PAGE FUNCTIONS
 # =============================================================================
@@ -279,20 +515,41 @@ def show_login_page():
         if check_password(password):
             st.session_state.authenticated = True
             st.session_state.page = "home"
-            st.session_state.resolutions = load_data()
+            set_resolutions(load_data())
             st.rerun()
         else:
             st.error("Incorrect password. Please try again.")
 
 
+def render_resolution_card(res, key_prefix, show_target=False):
+    """
+    Display a resolution as a card with a View button.
+    Shared by the home page and the all resolutions page.
+    """
+    with st.container():
+        col1, col2 = st.columns([3, 1])
+
+        with col1:
+            # Show achieved badge if all milestones complete
+            achieved_badge = "✅ " if res["achieved"] else ""
+            st.markdown(f"**{achieved_badge}{res['title']}**")
+            st.caption(f"Importance: {display_importance_stars(res['importance'])} | Progress: {res['completed_count']}/4 ⭐")
+            if show_target:
+                st.caption(f"Target: {format_date(res['target_date'])}")
+
+        with col2:
+            st.button("View", key=f"{key_prefix}_{res['id']}", on_click=navigate_to, args=("resolution",), kwargs={"resolution_id": res["id"]})
+
+        st.divider()
+
+
 def show_home_page():
     """
     Display the home page with top 3 resolutions and total star count.
     """
     st.title("🎯 Resolution Tracker")
 
-    # Reload data to ensure we have the latest
-    st.session_state.resolutions = load_data()
+    # Session state is kept current by every save, so no reload is needed here
     resolutions = st.session_state.resolutions
 
     # Display total stars
@@ -310,30 +567,10 @@ def show_home_page():
         top_resolutions = get_top_resolutions(resolutions, 3)
 
         for res in top_resolutions:
-            # Count completed milestones for this resolution
-            completed_count = sum(1 for m in res["milestones"] if m["completed"])
-
-            # Create a card-like display
-            with st.container():
-                col1, col2 = st.columns([3, 1])
-
-                with col1:
-                    # Show achieved badge if all milestones complete
-                    achieved_badge = "✅ " if res["achieved"] else ""
-                    st.markdown(f"**{achieved_badge}{res['title']}**")
-                    st.caption(f"Importance: {display_importance_stars(res['importance'])} | Progress: {completed_count}/4 ⭐")
-
-                with col2:
-                    if st.button("View", key=f"view_{res['id']}"):
-                        navigate_to("resolution", resolution_id=res["id"])
-                        st.rerun()
-
-                st.divider()
+            render_resolution_card(res, key_prefix="view")
 
     # Navigation button
-    if st.button("📋 All Resolutions", type="primary"):
-        navigate_to("all")
-        st.rerun()
+    st.button("📋 All Resolutions", type="primary", on_click=navigate_to, args=("all",))
 
 
 def show_all_resolutions_page():
@@ -345,13 +582,9 @@ def show_all_resolutions_page():
     # Navigation buttons
     col1, col2 = st.columns(2)
     with col1:
-        if st.button("🏠 Home"):
-            navigate_to("home")
-            st.rerun()
+        st.button("🏠 Home", on_click=navigate_to, args=("home",))
     with col2:
-        if st.button("➕ Create New Resolution", type="primary"):
-            navigate_to("create")
-            st.rerun()
+        st.button("➕ Create New Resolution", type="primary", on_click=navigate_to, args=("create",))
 
     st.divider()
 
@@ -365,23 +598,7 @@ def show_all_resolutions_page():
         sorted_resolutions = sorted(resolutions, key=lambda x: x["importance"], reverse=True)
 
         for res in sorted_resolutions:
-            completed_count = sum(1 for m in res["milestones"] if m["completed"])
-
-            with st.container():
-                col1, col2 = st.columns([3, 1])
-
-                with col1:
-                    achieved_badge = "✅ " if res["achieved"] else ""
-                    st.markdown(f"**{achieved_badge}{res['title']}**")
-                    st.caption(f"Importance: {display_importance_stars(res['importance'])} | Progress: {completed_count}/4 ⭐")
-                    st.caption(f"Target: {format_date(res['target_date'])}")
-
-                with col2:
-                    if st.button("View", key=f"all_view_{res['id']}"):
-                        navigate_to("resolution", resolution_id=res["id"])
-                        st.rerun()
-
-                st.divider()
+            render_resolution_card(res, key_prefix="all_view", show_target=True)
 
 
 def show_individual_resolution_page():
@@ -389,20 +606,15 @@ def show_individual_resolution_page():
     Display an individual resolution with all its details and milestones.
     """
     resolution_id = st.session_state.selected_resolution_id
-    resolutions = st.session_state.resolutions
-    resolution = get_resolution_by_id(resolutions, resolution_id)
+    resolution = get_resolution_by_id(st.session_state.res_by_id, resolution_id)
 
     if not resolution:
         st.error("Resolution not found!")
-        if st.button("🏠 Go Home"):
-            navigate_to("home")
-            st.rerun()
+        st.button("🏠 Go Home", on_click=navigate_to, args=("home",))
         return
 
     # Navigation
-    if st.button("🏠 Home"):
-        navigate_to("home")
-        st.rerun()
+    st.button("🏠 Home", on_click=navigate_to, args=("home",))
 
     st.divider()
 
@@ -422,8 +634,7 @@ def show_individual_resolution_page():
         st.markdown(f"**Target Date:** {format_date(resolution['target_date'])}")
     with col2:
         st.markdown(f"**Importance:** {display_importance_stars(resolution['importance'])}")
-        completed_count = sum(1 for m in resolution["milestones"] if m["completed"])
-        st.markdown(f"**Progress:** {completed_count}/4 ⭐")
+        st.markdown(f"**Progress:** {resolution['completed_count']}/4 ⭐")
 
     st.markdown(f"**Why this matters:** {resolution['reason']}")
 
@@ -445,9 +656,7 @@ def show_individual_resolution_page():
                     st.caption(f"Note: {milestone['note']}")
 
             with col2:
-                if st.button("Edit", key=f"milestone_{i}"):
-                    navigate_to("milestone", resolution_id=resolution_id, milestone_index=i)
-                    st.rerun()
+                st.button("Edit", key=f"milestone_{i}", on_click=navigate_to, args=("milestone",), kwargs={"resolution_id": resolution_id, "milestone_index": i})
 
         st.divider()
 
@@ -456,14 +665,10 @@ def show_individual_resolution_page():
     col1, col2 = st.columns(2)
 
     with col1:
-        if st.button("✏️ Edit Resolution"):
-            st.session_state.edit_mode = True
-            st.rerun()
+        st.button("✏️ Edit Resolution", on_click=set_state, args=("edit_mode", True))
 
     with col2:
-        if st.button("🗑️ Delete Resolution", type="secondary"):
-            st.session_state.confirm_delete = True
-            st.rerun()
+        st.button("🗑️ Delete Resolution", type="secondary", on_click=set_state, args=("confirm_delete", True))
 
     # Confirm delete dialog
     if st.session_state.get("confirm_delete", False):
@@ -471,15 +676,13 @@ def show_individual_resolution_page():
         col1, col2 = st.columns(2)
         with col1:
             if st.button("Yes, Delete", type="primary"):
-                st.session_state.resolutions = delete_resolution(resolutions, resolution_id)
-                save_data(st.session_state.resolutions)
+                with mutate_resolutions({"op": "delete", "id": resolution_id}):
+                    remove_resolution(resolution_id)
                 st.session_state.confirm_delete = False
                 navigate_to("all")
                 st.rerun()
         with col2:
-            if st.button("Cancel"):
-                st.session_state.confirm_delete = False
-                st.rerun()
+            st.button("Cancel", on_click=set_state, args=("confirm_delete", False))
 
 
 def show_edit_resolution_form(resolution):
@@ -493,9 +696,9 @@ def show_edit_resolution_form(resolution):
 
         col1, col2 = st.columns(2)
         with col1:
-            start_date = st.date_input("Start Date", value=datetime.strptime(resolution["start_date"], "%Y-%m-%d"))
+            start_date = st.date_input("Start Date", value=resolution["start_date"])
         with col2:
-            target_date = st.date_input("Target Date", value=datetime.strptime(resolution["target_date"], "%Y-%m-%d"))
+            target_date = st.date_input("Target Date", value=resolution["target_date"])
 
         reason = st.text_area("Why is this important to you?", value=resolution["reason"])
         importance = st.slider("Importance (1-5)", 1, 5, value=resolution["importance"])
@@ -511,38 +714,30 @@ def show_edit_resolution_form(resolution):
         with col1:
             submitted = st.form_submit_button("💾 Save Changes", type="primary")
         with col2:
-            cancelled = st.form_submit_button("Cancel")
+            st.form_submit_button("Cancel", on_click=set_state, args=("edit_mode", False))
 
         if submitted:
             # Update the resolution
             updated_data = {
                 "title": title,
-                "start_date": str(start_date),
-                "target_date": str(target_date),
+                "start_date": start_date,
+                "target_date": target_date,
                 "reason": reason,
                 "importance": importance,
             }
 
             # Update milestone descriptions (preserve completed status and notes)
-            for i, desc in enumerate(milestone_descriptions):
-                resolution["milestones"][i]["description"] = desc
-
-            updated_data["milestones"] = resolution["milestones"]
+            updated_data["milestones"] = [
+                {**m, "description": desc}
+                for m, desc in zip(resolution["milestones"], milestone_descriptions)
+            ]
 
-            st.session_state.resolutions = update_resolution(
-                st.session_state.resolutions,
-                resolution["id"],
-                updated_data
-            )
-            save_data(st.session_state.resolutions)
+            with mutate_resolutions({"op": "update", "id": resolution["id"], "data": updated_data}):
+                update_resolution(st.session_state.res_by_id, resolution["id"], updated_data)
             st.session_state.edit_mode = False
             st.success("Resolution updated!")
             st.rerun()
 
-        if cancelled:
-            st.session_state.edit_mode = False
-            st.rerun()
-
 
 def show_individual_milestone_page():
     """
@@ -550,22 +745,17 @@ def show_individual_milestone_page():
     """
     resolution_id = st.session_state.selected_resolution_id
     milestone_index = st.session_state.selected_milestone_index
-    resolutions = st.session_state.resolutions
-    resolution = get_resolution_by_id(resolutions, resolution_id)
+    resolution = get_resolution_by_id(st.session_state.res_by_id, resolution_id)
 
     if not resolution or milestone_index is None:
         st.error("Milestone not found!")
-        if st.button("🏠 Go Home"):
-            navigate_to("home")
-            st.rerun()
+        st.button("🏠 Go Home", on_click=navigate_to, args=("home",))
         return
 
     milestone = resolution["milestones"][milestone_index]
 
     # Back button
-    if st.button("⬅️ Back to Resolution"):
-        navigate_to("resolution", resolution_id=resolution_id)
-        st.rerun()
+    st.button("⬅️ Back to Resolution", on_click=navigate_to, args=("resolution",), kwargs={"resolution_id": resolution_id})
 
     st.divider()
 
@@ -580,6 +770,18 @@ def show_individual_milestone_page():
 
     st.divider()
 
+    show_milestone_editor(resolution, milestone_index)
+
+
+@st.fragment
+def show_milestone_editor(resolution, milestone_index):
+    """
+    Display the completion checkbox, note field and Save button for a milestone.
+    Runs as a fragment, so changing these widgets only reruns this section.
+    """
+    resolution_id = resolution["id"]
+    milestone = resolution["milestones"][milestone_index]
+
     # Completion checkbox
     was_completed = milestone["completed"]
     completed = st.checkbox(
@@ -601,20 +803,17 @@ def show_individual_milestone_page():
         # Check if milestone was just completed
         just_completed = completed and not was_completed
 
-        # Update milestone
-        st.session_state.resolutions = mark_milestone_complete(
-            st.session_state.resolutions,
-            resolution_id,
-            milestone_index,
-            completed
-        )
-        st.session_state.resolutions = add_milestone_note(
-            st.session_state.resolutions,
-            resolution_id,
-            milestone_index,
-            note
-        )
-        save_data(st.session_state.resolutions)
+        # Update milestone and write it out once
+        event = {
+            "op": "milestone_toggle",
+            "id": resolution_id,
+            "index": milestone_index,
+            "completed": completed,
+            "note": note
+        }
+        with mutate_resolutions(event):
+            mark_milestone_complete(st.session_state.res_by_id, resolution_id, milestone_index, completed)
+            add_milestone_note(st.session_state.res_by_id, resolution_id, milestone_index, note)
 
         # Show celebration if just completed
         if just_completed:
@@ -622,8 +821,7 @@ def show_individual_milestone_page():
             st.success("🎉 Congratulations! You've completed this milestone! Keep up the great work! ⭐")
 
             # Check if all milestones are now complete
-            updated_resolution = get_resolution_by_id(st.session_state.resolutions, resolution_id)
-            if updated_resolution["achieved"]:
+            if resolution["achieved"]:
                 st.success("🏆 AMAZING! You've achieved your entire resolution! All 4 milestones complete! 🎊")
         else:
             st.success("Milestone saved!")
@@ -643,9 +841,7 @@ def show_create_resolution_page():
     st.title("➕ Create New Resolution")
 
     # Back button
-    if st.button("⬅️ Back to All Resolutions"):
-        navigate_to("all")
-        st.rerun()
+    st.button("⬅️ Back to All Resolutions", on_click=navigate_to, args=("all",))
 
     st.divider()
 
@@ -695,8 +891,8 @@ def show_create_resolution_page():
                 )
 
                 # Add to list and save
-                st.session_state.resolutions.append(new_resolution)
-                save_data(st.session_state.resolutions)
+                with mutate_resolutions({"op": "create", "resolution": new_resolution}):
+                    add_resolution(new_resolution)
 
                 st.success("Resolution created successfully! 🎉")
                 navigate_to("all")